@@ -1,36 +1,10 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
-"""Astrophysical population models."""
-
-from .simulate import (
-    make_catalog_random_positions_cube,
-    make_catalog_random_positions_sphere,
-    make_base_catalog_galactic,
-    add_snr_parameters,
-    add_pulsar_parameters,
-    add_pwn_parameters,
-    add_observed_parameters,
-)
-
-from .spatial import (
-    CaseBattacharya1998,
-    FaucherKaspi2006,
-    Lorimer2006,
-    Paczynski1990,
-    YusifovKucuk2004,
-    YusifovKucuk2004B,
-    Exponential,
-    LogSpiral,
-    FaucherSpiral,
-    ValleeSpiral,
-    radial_distributions,
-)
-from .velocity import (
-    FaucherKaspi2006VelocityMaxwellian,
-    FaucherKaspi2006VelocityBimodal,
-    Paczynski1990Velocity,
-    velocity_distributions,
-)
+"""Astrophysical population models.
 
+The sub-modules are imported lazily on first attribute access (PEP 562),
+so that importing the package does not build all the model classes.
+"""
+import importlib
 
 __all__ = [
     "add_observed_parameters",
@@ -56,3 +30,41 @@ __all__ = [
     "YusifovKucuk2004",
     "YusifovKucuk2004B",
 ]
+
+_LAZY = {
+    "add_observed_parameters": "simulate",
+    "add_pulsar_parameters": "simulate",
+    "add_pwn_parameters": "simulate",
+    "add_snr_parameters": "simulate",
+    "make_base_catalog_galactic": "simulate",
+    "make_catalog_random_positions_cube": "simulate",
+    "make_catalog_random_positions_sphere": "simulate",
+    "CaseBattacharya1998": "spatial",
+    "Exponential": "spatial",
+    "FaucherKaspi2006": "spatial",
+    "FaucherSpiral": "spatial",
+    "LogSpiral": "spatial",
+    "Lorimer2006": "spatial",
+    "Paczynski1990": "spatial",
+    "radial_distributions": "spatial",
+    "ValleeSpiral": "spatial",
+    "YusifovKucuk2004": "spatial",
+    "YusifovKucuk2004B": "spatial",
+    "FaucherKaspi2006VelocityBimodal": "velocity",
+    "FaucherKaspi2006VelocityMaxwellian": "velocity",
+    "Paczynski1990Velocity": "velocity",
+    "velocity_distributions": "velocity",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(f".{_LAZY[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,98 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Numba kernels for the background IRF evaluation.
+
+The kernels are only defined if ``numba`` is installed, otherwise
+``trilinear_bkg`` is None and the numpy implementation is used.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+__all__ = ["evaluate_trilinear_bkg"]
+
+# all fast-math flags except "nnan" and "ninf", so that non-finite
+# coordinates still propagate to the output and are handled by the caller
+FASTMATH_FLAGS = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+def _find_cell(nodes, x):
+    """Index of the cell of ``nodes`` containing ``x``.
+
+    Same as ``np.searchsorted(nodes, x) - 1``, clipped to the valid cell range.
+    """
+    lo, hi = 0, nodes.shape[0]
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if nodes[mid] < x:
+            lo = mid + 1
+        else:
+            hi = mid
+    return min(max(lo - 1, 0), nodes.shape[0] - 2)
+
+
+def _trilinear_bkg(e, x, y, e_nodes, x_nodes, y_nodes, table, out):
+    """Trilinear interpolation of ``table`` at the points ``(e, x, y)``.
+
+    Coordinates and nodes are expected in interpolation scale, the
+    result is written into ``out``.
+    """
+    for n in prange(e.shape[0]):
+        i = _find_cell(e_nodes, e[n])
+        j = _find_cell(x_nodes, x[n])
+        k = _find_cell(y_nodes, y[n])
+
+        a = (e[n] - e_nodes[i]) / (e_nodes[i + 1] - e_nodes[i])
+        b = (x[n] - x_nodes[j]) / (x_nodes[j + 1] - x_nodes[j])
+        c = (y[n] - y_nodes[k]) / (y_nodes[k + 1] - y_nodes[k])
+
+        value = 0.0
+        for di in range(2):
+            wa = a if di else 1.0 - a
+            for dj in range(2):
+                wb = b if dj else 1.0 - b
+                for dk in range(2):
+                    wc = c if dk else 1.0 - c
+                    value += wa * wb * wc * table[i + di, j + dj, k + dk]
+        out[n] = value
+
+
+if njit is None:
+    trilinear_bkg = None
+else:
+    _find_cell = njit(fastmath=FASTMATH_FLAGS, cache=True)(_find_cell)
+    trilinear_bkg = njit(parallel=True, fastmath=FASTMATH_FLAGS, cache=True)(
+        _trilinear_bkg
+    )
+
+
+def evaluate_trilinear_bkg(coords, nodes, table):
+    """Evaluate the numba kernel on broadcastable coordinate arrays.
+
+    Parameters
+    ----------
+    coords : tuple of `~numpy.ndarray`
+        Scaled (energy, fov_lon, fov_lat) coordinates.
+    nodes : tuple of `~numpy.ndarray`
+        Scaled grid nodes for each axis.
+    table : `~numpy.ndarray`
+        Scaled values on the grid.
+
+    Returns
+    -------
+    values : `~numpy.ndarray`
+        Interpolated values, with the broadcasted shape of the coordinates.
+    """
+    shape = np.broadcast_shapes(*[np.shape(_) for _ in coords])
+    e, x, y = [
+        np.ascontiguousarray(np.broadcast_to(_, shape), dtype=np.float64).ravel()
+        for _ in coords
+    ]
+    nodes = [np.ascontiguousarray(_, dtype=np.float64) for _ in nodes]
+    table = np.ascontiguousarray(table, dtype=np.float64)
+
+    out = np.empty(e.shape, dtype=np.float64)
+    trilinear_bkg(e, x, y, *nodes, table, out)
+    return out.reshape(shape)
@@ -2,8 +2,10 @@
 import logging
 import numpy as np
 import astropy.units as u
+from astropy.utils import lazyproperty
 from astropy.visualization import quantity_support
 from gammapy.maps import MapAxes, MapAxis
+from gammapy.utils.interpolation import interpolation_scale
 from .core import IRF
 from .io import gadf_is_pointlike
 
@@ -11,6 +13,10 @@ __all__ = ["Background3D", "Background2D"]
 
 log = logging.getLogger(__name__)
 
+# minimum number of points for which the compiled numba kernel is used, below
+# the numpy kernel is as fast and avoids importing and compiling numba
+NUMBA_MIN_SIZE = 1_000_000
+
 
 class BackgroundIRF(IRF):
     """Background IRF base class"""
@@ -119,6 +125,154 @@ class Background3D(BackgroundIRF):
     required_axes = ["energy", "fov_lon", "fov_lat"]
     default_unit = u.s**-1 * u.MeV**-1 * u.sr**-1
 
+    @lazyproperty
+    def _axes_nodes(self):
+        """Unit, interpolation scale and scaled nodes for each axis"""
+        axes_nodes = []
+
+        for axis in self.axes:
+            scale = interpolation_scale(axis.interp)
+            axes_nodes.append((axis.unit, scale, scale(axis.center.value)))
+
+        return axes_nodes
+
+    @lazyproperty
+    def _values_scaled(self):
+        values_scale = self.interp_kwargs.get("values_scale", "lin")
+        values = interpolation_scale(values_scale)(self.data)
+        return np.asarray(values, dtype=np.float64)
+
+    def _interpolate_coords(self, coords, method=None):
+        if method is None:
+            method = self.interp_kwargs.get("method", "linear")
+
+        # the trilinear kernel requires at least two nodes per axis,
+        # otherwise fall back to the generic interpolator
+        if method != "linear" or min(self.axes.shape) < 2:
+            return super()._interpolate_coords(coords, method=method)
+
+        return self._evaluate_trilinear(**coords)
+
+    def _evaluate_trilinear(self, energy, fov_lon, fov_lat):
+        """Trilinear interpolation on the regular (energy, fov_lon, fov_lat) grid.
+
+        Equivalent to `~gammapy.utils.interpolation.ScaledRegularGridInterpolator`
+        with ``method="linear"``, including the extrapolation within the outer
+        bins. For large batches a compiled kernel is used if ``numba`` is
+        installed, otherwise the interpolation is done with plain numpy.
+
+        Parameters
+        ----------
+        energy : `~astropy.units.Quantity`
+            Energy
+        fov_lon, fov_lat : `~astropy.coordinates.Angle`
+            FoV coordinates
+
+        Returns
+        -------
+        values : `~astropy.units.Quantity`
+            Interpolated background rate
+        """
+        coords = []
+
+        for coord, (unit, scale, _) in zip(
+            [energy, fov_lon, fov_lat], self._axes_nodes
+        ):
+            coords.append(scale(coord.to_value(unit)))
+
+        nodes = [nodes for _, _, nodes in self._axes_nodes]
+        size = np.prod(np.broadcast_shapes(*[np.shape(_) for _ in coords]))
+
+        trilinear_bkg = None
+        if size >= NUMBA_MIN_SIZE:
+            from ._background_numba import evaluate_trilinear_bkg, trilinear_bkg
+
+        if trilinear_bkg is not None:
+            values = evaluate_trilinear_bkg(coords, nodes, self._values_scaled)
+        else:
+            values = self._trilinear_kernel(coords, nodes)
+
+        values_scale = interpolation_scale(
+            self.interp_kwargs.get("values_scale", "lin")
+        )
+        values = np.clip(values_scale.inverse(values), 0, np.inf)
+        return u.Quantity(values, self.unit, copy=False)
+
+    def _trilinear_kernel(self, coords, nodes):
+        """Numpy implementation of the trilinear interpolation kernel"""
+        table = self._values_scaled
+        strides = [table.shape[1] * table.shape[2], table.shape[2], 1]
+        base, weights = 0, []
+
+        for x, x_nodes, stride in zip(coords, nodes, strides):
+            dx = np.diff(x_nodes)
+
+            if np.ptp(dx) <= 1e-10 * np.abs(dx[0]):
+                # regular grid, the cell index follows directly from the coordinate
+                # non-finite coordinates are mapped to a valid cell and
+                # propagate to the result through frac, as in the other branch
+                t = (np.asarray(x) - x_nodes[0]) / dx[0]
+                i = np.clip(np.nan_to_num(np.floor(t)), 0, len(x_nodes) - 2)
+                i = i.astype(int)
+                frac = t - i
+            else:
+                i = np.clip(np.searchsorted(x_nodes, x) - 1, 0, len(x_nodes) - 2)
+                frac = (x - x_nodes[i]) / dx[i]
+
+            base = base + i * stride
+            weights.append((1 - frac, frac))
+
+        # accumulate the 8 cell corners, indexing into the flattened table
+        table, values = table.ravel(), 0
+        (wa0, wa1), (wb0, wb1), (wc0, wc1) = weights
+
+        for di, wa in [(0, wa0), (1, wa1)]:
+            for dj, wb in [(0, wb0), (1, wb1)]:
+                offset = di * strides[0] + dj * strides[1]
+                values_ij = wc0 * table.take(base + offset)
+                values_ij += wc1 * table.take(base + offset + 1)
+                values = values + wa * wb * values_ij
+
+        return values
+
+    def integrate_on_energy_range(
+        self, energy_range, fov_lon, fov_lat, n_integration_bins=10
+    ):
+        """Integrate the background rate over a given energy range.
+
+        The rate is evaluated in a single call on a log-spaced energy grid,
+        broadcasted against the FoV coordinates, and integrated using
+        log-log trapezoidal integration.
+
+        Parameters
+        ----------
+        energy_range : `~astropy.units.Quantity`
+            Energy range ``(energy_min, energy_max)``
+        fov_lon, fov_lat : `~astropy.coordinates.Angle`
+            FoV coordinates
+        n_integration_bins : int
+            Number of energy bins used for the integration.
+
+        Returns
+        -------
+        rate : `~astropy.units.Quantity`
+            Integrated background rate, with the broadcasted shape of the
+            FoV coordinates.
+        """
+        fov_lon, fov_lat = u.Quantity(fov_lon), u.Quantity(fov_lat)
+        ndim = len(np.broadcast_shapes(fov_lon.shape, fov_lat.shape))
+
+        energy_min, energy_max = u.Quantity(energy_range)
+        energy = np.geomspace(energy_min, energy_max, n_integration_bins + 1)
+
+        rate = self.integrate_log_log(
+            axis_name="energy",
+            energy=energy.reshape((-1,) + (1,) * ndim),
+            fov_lon=fov_lon,
+            fov_lat=fov_lat,
+        )
+        return rate.sum(axis=0)
+
     def to_2d(self):
         """Convert to `Background2D`.
 
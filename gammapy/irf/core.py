@@ -79,7 +79,7 @@ class IRF(metaclass=abc.ABCMeta):
                 self._unit = data.unit
         else:
             self.data = data
-            self._unit = unit
+            self._unit = u.Unit(unit)
         self.meta = meta or {}
         if interp_kwargs is None:
             interp_kwargs = self.default_interp_kwargs.copy()
@@ -142,6 +142,7 @@ class IRF(metaclass=abc.ABCMeta):
         # reset cached interpolators
         self.__dict__.pop("_interpolate", None)
         self.__dict__.pop("_integrate_rad", None)
+        self.__dict__.pop("_values_scaled", None)
 
     def interp_missing_data(self, axis_name):
         """Interpolate missing data along a given axis"""
@@ -272,11 +273,10 @@ class IRF(metaclass=abc.ABCMeta):
             if coord is not None:
                 coords_default[key] = u.Quantity(coord, copy=False)
 
-        data = self._interpolate(coords_default.values(), method=method)
+        data = self._interpolate_coords(coords_default, method=method)
 
         if self.interp_kwargs["fill_value"] is not None:
-            idxs = self.axes.coord_to_idx(coords_default, clip=False)
-            invalid = np.broadcast_arrays(*[idx == -1 for idx in idxs])
+            invalid = np.broadcast_arrays(*self._invalid_coords(coords_default))
             mask = self._mask_out_bounds(invalid)
             if not data.shape:
                 mask = mask.squeeze()
@@ -284,6 +284,28 @@ class IRF(metaclass=abc.ABCMeta):
             data[~np.isfinite(data)] = self.interp_kwargs["fill_value"]
         return data
 
+    def _interpolate_coords(self, coords, method=None):
+        """Interpolate IRF values at the given coordinates dict"""
+        return self._interpolate(coords.values(), method=method)
+
+    @lazyproperty
+    def _axes_edges(self):
+        """Axis units and bin edges as bare float arrays, keyed by axis name"""
+        return {axis.name: (axis.unit, axis.edges.value) for axis in self.axes}
+
+    def _invalid_coords(self, coords):
+        """Masks of out of bounds or non-finite coordinates, per axis.
+
+        Same as ``self.axes.coord_to_idx(coords, clip=False) == -1``, but
+        using the cached axis edges.
+        """
+        invalid = []
+        for name, coord in coords.items():
+            unit, edges = self._axes_edges[name]
+            value = u.Quantity(coord, unit, copy=False, ndmin=1).value
+            invalid.append(~((value >= edges[0]) & (value <= edges[-1])))
+        return invalid
+
     @staticmethod
     def _mask_out_bounds(invalid):
         return np.any(invalid, axis=0)
@@ -1,4 +1,5 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+from copy import deepcopy
 import pytest
 import numpy as np
 from numpy.testing import assert_allclose
@@ -8,8 +9,7 @@ from gammapy.maps import MapAxis
 from gammapy.utils.testing import mpl_plot_check, requires_data, requires_dependency
 
 
-@pytest.fixture(scope="session")
-def bkg_3d():
+def _build_bkg_3d():
     """Example with simple values to test evaluate"""
     energy = [0.1, 10, 1000] * u.TeV
     energy_axis = MapAxis.from_energy_edges(energy)
@@ -29,8 +29,7 @@ def bkg_3d():
     )
 
 
-@pytest.fixture(scope="session")
-def bkg_3d_interp():
+def _build_bkg_3d_interp():
     """Example with simple values to test evaluate"""
     energy = np.logspace(-1, 3, 6) * u.TeV
     energy_axis = MapAxis.from_energy_edges(energy)
@@ -55,6 +54,21 @@ def bkg_3d_interp():
     return bkg
 
 
+_BKG_3D = _build_bkg_3d()
+_BKG_3D_INTERP = _build_bkg_3d_interp()
+
+
+@pytest.fixture(scope="session")
+def bkg_3d():
+    return _BKG_3D
+
+
+@pytest.fixture
+def bkg_3d_interp():
+    # copy per test, because the missing values test modifies the data in place
+    return deepcopy(_BKG_3D_INTERP)
+
+
 @requires_data()
 def test_background_3d_basics(bkg_3d):
     assert "Background3D" in str(bkg_3d)
@@ -130,6 +144,83 @@ def test_background_3d_evaluate(bkg_3d):
     assert res.shape == (2, 2)
 
 
+def test_background_3d_evaluate_trilinear(bkg_3d_interp):
+    coords = dict(
+        energy=[[0.2], [5], [300]] * u.TeV,
+        fov_lon=[0.2, 1.3, 2.9] * u.deg,
+        fov_lat=[[0.5], [1.7], [2.2]] * u.deg,
+    )
+    res = bkg_3d_interp._evaluate_trilinear(**coords)
+    expected = bkg_3d_interp._interpolate(coords.values())
+    assert_allclose(res.value, expected.value, rtol=1e-10)
+    assert res.shape == (3, 3)
+    assert res.unit == "s-1 GeV-1 sr-1"
+
+
+def test_background_3d_evaluate_trilinear_irregular():
+    energy_axis = MapAxis.from_energy_edges([0.1, 0.3, 2, 10, 1000] * u.TeV)
+    fov_lon_axis = MapAxis.from_edges([-3, -1, 0, 0.5, 3] * u.deg, name="fov_lon")
+    fov_lat_axis = MapAxis.from_edges([-3, 0, 1, 3] * u.deg, name="fov_lat")
+    data = np.random.default_rng(0).uniform(1, 2, (4, 4, 3))
+    bkg = Background3D(
+        axes=[energy_axis, fov_lon_axis, fov_lat_axis], data=data, unit="s-1 MeV-1 sr-1"
+    )
+
+    coords = dict(
+        energy=[[0.2], [5], [300]] * u.TeV,
+        fov_lon=[-2.1, 0.2, 2.9] * u.deg,
+        fov_lat=[[-0.5], [0.7], [2.2]] * u.deg,
+    )
+    res = bkg._evaluate_trilinear(**coords)
+    expected = bkg._interpolate(coords.values())
+    assert_allclose(res.value, expected.value, rtol=1e-10)
+
+
+@pytest.mark.parametrize("name", ["energy", "fov_lon", "fov_lat"])
+def test_background_3d_evaluate_non_finite(name):
+    energy_axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=7)
+    fov_lon_axis = MapAxis.from_bounds(-3, 3, nbin=7, unit="deg", name="fov_lon")
+    fov_lat_axis = MapAxis.from_bounds(-3, 3, nbin=5, unit="deg", name="fov_lat")
+    bkg = Background3D(
+        axes=[energy_axis, fov_lon_axis, fov_lat_axis],
+        data=np.ones((7, 7, 5)),
+        unit="s-1 MeV-1 sr-1",
+    )
+
+    coords = dict(energy=[2, 2] * u.TeV, fov_lon=[0, 0] * u.deg, fov_lat=[0, 0] * u.deg)
+    coords[name][0] = np.nan
+    res = bkg.evaluate(**coords)
+    assert_allclose(res.value, [0, 1])
+
+
+@requires_dependency("numba")
+def test_background_3d_evaluate_numba(bkg_3d_interp):
+    from gammapy.irf._background_numba import evaluate_trilinear_bkg
+
+    coords = (np.log([[0.2], [5], [300]]), [0.2, 1.3, 2.9], [[0.5], [1.7], [2.2]])
+    nodes = [np.log(bkg_3d_interp.axes[0].center.value)] + [
+        axis.center.value for axis in bkg_3d_interp.axes[1:]
+    ]
+    res = evaluate_trilinear_bkg(coords, nodes, bkg_3d_interp._values_scaled)
+    expected = bkg_3d_interp._trilinear_kernel(coords, nodes)
+    assert_allclose(res, expected, rtol=1e-10)
+    assert res.shape == (3, 3)
+
+
+@requires_dependency("numba")
+def test_background_3d_evaluate_numba_dispatch(bkg_3d_interp, monkeypatch):
+    coords = dict(
+        energy=[[0.2], [5], [300]] * u.TeV,
+        fov_lon=[0.2, 1.3, 2.9] * u.deg,
+        fov_lat=[[0.5], [1.7], [2.2]] * u.deg,
+    )
+    expected = bkg_3d_interp._evaluate_trilinear(**coords)
+
+    monkeypatch.setattr("gammapy.irf.background.NUMBA_MIN_SIZE", 0)
+    res = bkg_3d_interp._evaluate_trilinear(**coords)
+    assert_allclose(res.value, expected.value, rtol=1e-10)
+
+
 @requires_dependency("matplotlib")
 def test_plot_at_energy(bkg_3d):
     with mpl_plot_check():
@@ -201,6 +292,23 @@ def test_background_3d_integrate(bkg_3d):
     assert_allclose(rate.to("s-1 sr-1").value, [[99000.0, 99000.0]], rtol=1e-5)
 
 
+def test_background_3d_integrate_on_energy_range(bkg_3d):
+    rate = bkg_3d.integrate_on_energy_range(
+        energy_range=[1, 100] * u.TeV,
+        fov_lon=[0.5, 2.5] * u.deg,
+        fov_lat=0.5 * u.deg,
+        n_integration_bins=5,
+    )
+    assert rate.shape == (2,)
+    assert_allclose(rate.to_value("s-1 sr-1"), [99000.0, 99000.0], rtol=1e-5)
+
+    rate = bkg_3d.integrate_on_energy_range(
+        energy_range=[1, 100] * u.TeV, fov_lon=1.5 * u.deg, fov_lat=1.5 * u.deg
+    )
+    assert rate.shape == ()
+    assert rate.to_value("s-1 sr-1") > 99000
+
+
 @requires_data()
 def test_background_3d_read():
     filename = (
@@ -270,8 +378,7 @@ def test_background_2d_read_missing_hducls():
     assert bkg.axes[0].name == "energy"
 
 
-@pytest.fixture(scope="session")
-def bkg_2d():
+def _build_bkg_2d():
     """A simple Background2D test case"""
     energy = [0.1, 10, 1000] * u.TeV
     energy_axis = MapAxis.from_energy_edges(energy)
@@ -286,6 +393,14 @@ def bkg_2d():
     )
 
 
+_BKG_2D = _build_bkg_2d()
+
+
+@pytest.fixture(scope="session")
+def bkg_2d():
+    return _BKG_2D
+
+
 def test_background_2d_evaluate(bkg_2d):
     # TODO: the test cases here can probably be improved a bit
     # There's some redundancy, and no case exactly at a node in energy
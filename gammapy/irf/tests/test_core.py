@@ -40,3 +40,22 @@ def test_immutable():
 
     with pytest.raises(AttributeError):
         test_irf.fov_alignment = FoVAlignment.ALTAZ
+
+
+def test_invalid_coords():
+    energy_axis = MapAxis.from_energy_bounds(10, 100, 10, unit="TeV", name="energy")
+    offset_axis = MapAxis.from_bounds(0, 2.5, 5, unit="deg", name="offset")
+    irf = TestIRF(axes=[energy_axis, offset_axis], data=1, unit=u.deg)
+
+    coords = {
+        "energy": [5, 10, 50, 100, 200, np.nan] * u.TeV,
+        "offset": [-1, 0, 1, 2.5, np.inf, 1] * u.deg,
+    }
+    idxs = irf.axes.coord_to_idx(coords, clip=False)
+    invalid = irf._invalid_coords(coords)
+
+    for idx, mask in zip(idxs, invalid):
+        assert np.all(mask == (idx == -1))
+
+    value = irf.evaluate(energy=50 * u.TeV, offset=[1, 3] * u.deg)
+    assert np.all(value.value == [1, 0])
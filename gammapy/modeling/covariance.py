@@ -1,7 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """Covariance class"""
 import numpy as np
-import scipy
 from .parameter import Parameters
 
 __all__ = ["Covariance"]
@@ -199,7 +198,9 @@ class Covariance:
     @property
     def scipy_mvn(self):
         # TODO: use this, as in https://github.com/cdeil/multinorm/blob/master/multinorm.py
-        return scipy.stats.multivariate_normal(
+        from scipy.stats import multivariate_normal
+
+        return multivariate_normal(
             self.parameters.value, self.data, allow_singular=True
         )
 
@@ -2,7 +2,6 @@
 """iminuit fitting functions."""
 import logging
 import numpy as np
-from scipy.stats import chi2, norm
 from .likelihood import Likelihood
 
 __all__ = [
@@ -113,6 +112,8 @@ def covariance_iminuit(parameters, function, **kwargs):
 
 
 def confidence_iminuit(parameters, function, parameter, reoptimize, sigma, **kwargs):
+    from scipy.stats import norm
+
     # TODO: this is ugly - design something better for translating to MINUIT parameter names.
     if not reoptimize:
         log.warning("Reoptimize = False ignored for iminuit backend")
@@ -153,6 +154,8 @@ def confidence_iminuit(parameters, function, parameter, reoptimize, sigma, **kwa
 
 
 def contour_iminuit(parameters, function, x, y, numpoints, sigma, **kwargs):
+    from scipy.stats import chi2
+
     minuit, minuit_func = setup_iminuit(
         parameters=parameters, function=function, store_trace=False, **kwargs
     )
@@ -117,11 +117,18 @@ class ModelBase:
     @property
     def covariance(self):
         self._check_covariance()
-        for par in self.parameters:
-            pars = Parameters([par])
-            error = np.nan_to_num(par.error ** 2, nan=1)
-            covar = Covariance(pars, data=[[error]])
-            self._covariance.set_subcovariance(covar)
+        parameters = self._covariance.parameters
+        idx = np.array([parameters.index(par) for par in parameters], dtype=int)
+
+        errors = np.array([par.error for par in parameters], dtype=np.float64)
+        variance = np.nan_to_num(errors ** 2, nan=1)
+
+        # reset the correlations of parameters whose error was changed
+        data = self._covariance.data
+        changed = idx[~np.isclose(data[idx, idx], variance)]
+        data[changed, :] = 0
+        data[:, changed] = 0
+        data[idx, idx] = variance
 
         return self._covariance
 
@@ -130,10 +137,12 @@ class ModelBase:
         self._check_covariance()
         self._covariance.data = covariance
 
-        for par in self.parameters:
-            pars = Parameters([par])
-            variance = self._covariance.get_subcovariance(pars)
-            par.error = np.sqrt(variance)
+        parameters = self._covariance.parameters
+        idx = np.array([parameters.index(par) for par in parameters], dtype=int)
+        errors = np.sqrt(np.diagonal(self._covariance.data)[idx])
+
+        for par, error in zip(parameters, errors):
+            par.error = error
 
     @property
     def parameters(self):
@@ -189,14 +198,15 @@ class ModelBase:
                 f"Invalid model type {data['type']} for class {cls.__name__}"
             )
 
-        input_names = [_["name"] for _ in data["parameters"]]
+        input_parameters = {}
+        for par in data["parameters"]:
+            input_parameters.setdefault(par["name"], par)
 
         for par in cls.default_parameters:
             par_dict = par.to_dict()
             try:
-                index = input_names.index(par_dict["name"])
-                par_dict.update(data["parameters"][index])
-            except ValueError:
+                par_dict.update(input_parameters[par_dict["name"]])
+            except KeyError:
                 log.warning(
                     f"Parameter '{par_dict['name']}' not defined in YAML file. Using default value: {par_dict['value']} {par_dict['unit']}"
                 )
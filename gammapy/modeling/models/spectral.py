@@ -164,7 +164,8 @@ class SpectralModel(ModelBase):
         f_cov : `~astropy.units.Quantity`
             Error of the given function.
         """
-        eps = np.sqrt(np.diag(self.covariance)) * epsilon
+        covariance = self.covariance.data
+        eps = np.sqrt(np.diagonal(covariance)) * epsilon
 
         n, f_0 = len(self.parameters), fct(**kwargs)
         shape = (n, len(np.atleast_1d(f_0)))
@@ -180,7 +181,7 @@ class SpectralModel(ModelBase):
             df_dp[idx] = df.value / eps[idx]
             parameter.value -= eps[idx]
 
-        f_cov = df_dp.T @ self.covariance @ df_dp
+        f_cov = df_dp.T @ covariance @ df_dp
         f_err = np.sqrt(np.diagonal(f_cov))
         return u.Quantity([f_0.value, f_err], unit=f_0.unit)
 
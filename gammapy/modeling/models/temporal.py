@@ -1,7 +1,10 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """Time-dependent models."""
+import numbers
+from functools import lru_cache
 import numpy as np
-import scipy.interpolate
+import scipy.integrate
+import scipy.special
 from astropy import units as u
 from astropy.table import Table
 from astropy.time import Time
@@ -27,6 +30,36 @@ __all__ = [
 ]
 
 
+def _to_value(value, unit):
+    """Value in the given unit, bare numbers are passed through unchanged"""
+    if isinstance(value, u.Quantity):
+        return value.to_value(unit)
+    return value
+
+
+@lru_cache(maxsize=32)
+def _time_ref_mjd(t_ref, scale):
+    """Reference time given in mjd converted to mjd in the given time scale.
+
+    Cached, because the `~astropy.time.Time` scale conversion is expensive
+    compared to the integrals evaluated with the result.
+    """
+    return getattr(Time(t_ref, format="mjd"), scale).mjd
+
+
+@lru_cache(maxsize=32)
+def _read_table(filename, mtime_ns):
+    """Read a light curve table, cached by resolved filename and modification time.
+
+    The cached table is shared, callers have to copy it before modifying it.
+    """
+    return Table.read(filename)
+
+
+# extrapolation modes supported by `LightCurveTemplateTemporalModel.evaluate`
+EXTRAPOLATION_MODES = {"extrapolate": 0, "zeros": 1, "raise": 2, "const": 3}
+
+
 # TODO: make this a small ABC to define a uniform interface.
 class TemporalModel(ModelBase):
     """Temporal model base class.
@@ -34,6 +67,10 @@ class TemporalModel(ModelBase):
 
     _type = "temporal"
 
+    # draw integer or None seeds from a `~numpy.random.RandomState` in `sample_time`,
+    # set to False to use a `~numpy.random.Generator` (``np.random.default_rng``) instead
+    _use_legacy_rng = True
+
     def __call__(self, time):
         """Evaluate model
 
@@ -70,6 +107,24 @@ class TemporalModel(ModelBase):
         # TODO: this is a work-around for https://github.com/astropy/astropy/issues/10501
         return u.Quantity(np.sum(diff.to_value("day")), "day")
 
+    @staticmethod
+    def _time_delta(time, t_ref):
+        """Time difference ``time - t_ref`` in days.
+
+        Parameters
+        ----------
+        time : `~astropy.time.Time`
+            Time
+        t_ref : float
+            Reference time in mjd
+
+        Returns
+        -------
+        delta : `~numpy.ndarray`
+            Time difference in days
+        """
+        return time.mjd - _time_ref_mjd(float(t_ref), time.scale)
+
     def plot(self, time_range, ax=None, **kwargs):
         """
         Plot Temporal Model.
@@ -116,9 +171,11 @@ class TemporalModel(ModelBase):
             Stop time of the sampling.
         t_delta : `~astropy.units.Quantity`
             Time step used for sampling of the temporal model.
-        random_state : {int, 'random-seed', 'global-rng', `~numpy.random.RandomState`}
+        random_state : {int, 'random-seed', 'global-rng', `~numpy.random.RandomState`, `~numpy.random.Generator`}
             Defines random number generator initialisation.
-            Passed to `~gammapy.utils.random.get_random_state`.
+            Passed to `~gammapy.utils.random.get_random_state`, or to
+            `~numpy.random.default_rng` for int or None if ``_use_legacy_rng`` is False.
+            A `~numpy.random.Generator` is used as is.
 
         Returns
         -------
@@ -128,7 +185,15 @@ class TemporalModel(ModelBase):
         t_min = Time(t_min)
         t_max = Time(t_max)
         t_delta = u.Quantity(t_delta)
-        random_state = get_random_state(random_state)
+
+        is_seed = random_state is None or isinstance(
+            random_state, (numbers.Integral, np.integer)
+        )
+
+        if is_seed and not self._use_legacy_rng:
+            random_state = np.random.default_rng(random_state)
+        elif not isinstance(random_state, np.random.Generator):
+            random_state = get_random_state(random_state)
 
         ontime = u.Quantity((t_max - t_min).sec, "s")
 
@@ -144,11 +209,8 @@ class TemporalModel(ModelBase):
         #  is still incomplete, refactor once we change to recent numpy and astropy versions
         t_step = t_delta.to_value(time_unit)
         if hasattr(self, "table"):
-            t = np.arange(0, t_stop, t_step)
-
-            pdf = self.evaluate(t)
-
-            sampler = InverseCDFSampler(pdf=pdf, random_state=random_state)
+            t, sampler = self._get_time_sampler(t_stop=t_stop, t_step=t_step)
+            sampler.random_state = random_state
             time_pix = sampler.sample(n_events)[0]
             time = np.interp(time_pix, np.arange(len(t)), t) * time_unit
 
@@ -169,6 +231,32 @@ class TemporalModel(ModelBase):
         return t_min + time
 
 
+class _VectorizedIntegralMixin:
+    """Integral from the analytical primitive of the model.
+
+    Sub-classes implement ``_primitive(time)``, returning the primitive
+    in days as a `~numpy.ndarray` for `~astropy.time.Time` input.
+    """
+
+    def integral(self, t_min, t_max):
+        """Evaluate the integrated flux within the given time intervals
+
+        Parameters
+        ----------
+        t_min : `~astropy.time.Time`
+            Start times of observation
+        t_max : `~astropy.time.Time`
+            Stop times of observation
+
+        Returns
+        -------
+        norm : float
+            Integrated flux norm on the given time intervals
+        """
+        value = self._primitive(t_max) - self._primitive(t_min)
+        return u.Quantity(value, "day") / self.time_sum(t_min, t_max)
+
+
 class ConstantTemporalModel(TemporalModel):
     """Constant temporal model."""
 
@@ -197,7 +285,7 @@ class ConstantTemporalModel(TemporalModel):
         return (t_max - t_min) / self.time_sum(t_min, t_max)
 
 
-class LinearTemporalModel(TemporalModel):
+class LinearTemporalModel(_VectorizedIntegralMixin, TemporalModel):
     """Temporal model with a linear variation.
 
     For more information see :ref:`linear-temporal-model`.
@@ -222,34 +310,19 @@ class LinearTemporalModel(TemporalModel):
     @staticmethod
     def evaluate(time, alpha, beta, t_ref):
         """Evaluate at given times"""
-        return alpha + beta * (time - t_ref)
-
-    def integral(self, t_min, t_max):
-        """Evaluate the integrated flux within the given time intervals
+        time, t_ref = _to_value(time, "d"), _to_value(t_ref, "d")
+        alpha, beta = _to_value(alpha, ""), _to_value(beta, "d-1")
+        return u.Quantity(alpha + beta * (time - t_ref), "", copy=False)
 
-        Parameters
-        ----------
-        t_min : `~astropy.time.Time`
-            Start times of observation
-        t_max : `~astropy.time.Time`
-            Stop times of observation
-
-        Returns
-        -------
-        norm : float
-            Integrated flux norm on the given time intervals
-        """
+    def _primitive(self, time):
         pars = self.parameters
-        alpha = pars["alpha"]
-        beta = pars["beta"].quantity
-        t_ref = Time(pars["t_ref"].quantity, format="mjd")
-        value = alpha * (t_max - t_min) + beta / 2.0 * (
-            (t_max - t_ref) * (t_max - t_ref) - (t_min - t_ref) * (t_min - t_ref)
-        )
-        return value / self.time_sum(t_min, t_max)
+        alpha = pars["alpha"].value
+        beta = pars["beta"].quantity.to_value("d-1")
+        dt = self._time_delta(time, pars["t_ref"].quantity.to_value("d"))
+        return alpha * dt + beta / 2.0 * dt ** 2
 
 
-class ExpDecayTemporalModel(TemporalModel):
+class ExpDecayTemporalModel(_VectorizedIntegralMixin, TemporalModel):
     r"""Temporal model with an exponential decay.
 
     .. math::
@@ -272,31 +345,17 @@ class ExpDecayTemporalModel(TemporalModel):
     @staticmethod
     def evaluate(time, t0, t_ref):
         """Evaluate at given times"""
-        return np.exp(-(time - t_ref) / t0)
-
-    def integral(self, t_min, t_max):
-        """Evaluate the integrated flux within the given time intervals
-
-        Parameters
-        ----------
-        t_min : `~astropy.time.Time`
-            Start times of observation
-        t_max : `~astropy.time.Time`
-            Stop times of observation
+        time, t_ref, t0 = [_to_value(_, "d") for _ in (time, t_ref, t0)]
+        return u.Quantity(np.exp(-(time - t_ref) / t0), "", copy=False)
 
-        Returns
-        -------
-        norm : float
-            Integrated flux norm on the given time intervals
-        """
+    def _primitive(self, time):
         pars = self.parameters
-        t0 = pars["t0"].quantity
-        t_ref = Time(pars["t_ref"].quantity, format="mjd")
-        value = self.evaluate(t_max, t0, t_ref) - self.evaluate(t_min, t0, t_ref)
-        return -t0 * value / self.time_sum(t_min, t_max)
+        t0 = pars["t0"].quantity.to_value("d")
+        dt = self._time_delta(time, pars["t_ref"].quantity.to_value("d"))
+        return -t0 * np.exp(-dt / t0)
 
 
-class GaussianTemporalModel(TemporalModel):
+class GaussianTemporalModel(_VectorizedIntegralMixin, TemporalModel):
     r"""A Gaussian temporal profile
 
     .. math::
@@ -318,33 +377,17 @@ class GaussianTemporalModel(TemporalModel):
 
     @staticmethod
     def evaluate(time, t_ref, sigma):
-        return np.exp(-((time - t_ref) ** 2) / (2 * sigma ** 2))
-
-    def integral(self, t_min, t_max, **kwargs):
-        """Evaluate the integrated flux within the given time intervals
-
-        Parameters
-        ----------
-        t_min : `~astropy.time.Time`
-            Start times of observation
-        t_max : `~astropy.time.Time`
-            Stop times of observation
+        """Evaluate at given times"""
+        time, t_ref, sigma = [_to_value(_, "d") for _ in (time, t_ref, sigma)]
+        z = (time - t_ref) / sigma
+        return u.Quantity(np.exp(-0.5 * z * z), "", copy=False)
 
-        Returns
-        -------
-        norm : float
-            Integrated flux norm on the given time intervals
-        """
+    def _primitive(self, time):
         pars = self.parameters
-        sigma = pars["sigma"].quantity
-        t_ref = Time(pars["t_ref"].quantity, format="mjd")
+        sigma = pars["sigma"].quantity.to_value("d")
+        dt = self._time_delta(time, pars["t_ref"].quantity.to_value("d"))
         norm = np.sqrt(np.pi / 2) * sigma
-
-        u_min = (t_min - t_ref) / (np.sqrt(2) * sigma)
-        u_max = (t_max - t_ref) / (np.sqrt(2) * sigma)
-
-        integral = norm * (scipy.special.erf(u_max) - scipy.special.erf(u_min))
-        return integral / self.time_sum(t_min, t_max)
+        return norm * scipy.special.erf(dt / (np.sqrt(2) * sigma))
 
 
 class GeneralizedGaussianTemporalModel(TemporalModel):
@@ -403,13 +446,13 @@ class GeneralizedGaussianTemporalModel(TemporalModel):
         t_rise = pars["t_rise"].quantity
         t_decay = pars["t_decay"].quantity
         eta = pars["eta"].quantity
-        t_ref = Time(pars["t_ref"].quantity, format = "mjd")
+        t_ref = pars["t_ref"].quantity.to_value("d")
 
-        integral = scipy.integrate.quad(self.evaluate, t_min.mjd, t_max.mjd, args=(t_ref.mjd,t_rise,t_decay,eta))[0]
+        integral = scipy.integrate.quad(self.evaluate, t_min.mjd, t_max.mjd, args=(t_ref,t_rise,t_decay,eta))[0]
         return integral / self.time_sum(t_min, t_max).to_value("d")
 
 
-class LightCurveTemplateTemporalModel(TemporalModel):
+class LightCurveTemplateTemporalModel(_VectorizedIntegralMixin, TemporalModel):
     """Temporal light curve model.
 
     The lightcurve is given as a table with columns ``time`` and ``norm``.
@@ -419,8 +462,8 @@ class LightCurveTemplateTemporalModel(TemporalModel):
 
     The model does linear interpolation for times between the given ``(time, norm)`` values.
 
-    The implementation currently uses `scipy.interpolate. InterpolatedUnivariateSpline`,
-    using degree ``k=1`` to get linear interpolation.
+    The implementation uses `numpy.interp` for the evaluation, the
+    integration uses the exact primitive of the piecewise linear light curve.
     This class also contains an ``integral`` method, making the computation of
     mean fluxes for a given time interval a one-liner.
 
@@ -462,6 +505,9 @@ class LightCurveTemplateTemporalModel(TemporalModel):
 
     tag = ["LightCurveTemplateTemporalModel", "template"]
 
+    # number of time grids for which the sampling CDF is cached
+    CDF_CACHE_SIZE = 4
+
     def __init__(self, table, filename=None):
         self.table = table
         if filename is not None:
@@ -469,6 +515,47 @@ class LightCurveTemplateTemporalModel(TemporalModel):
         self.filename = filename
         super().__init__()
 
+    @property
+    def table(self):
+        """Light curve table (`~astropy.table.Table`)"""
+        return self._table
+
+    @table.setter
+    def table(self, table):
+        self._table = table
+        self._cdf_cache = {}
+
+        # reset cached interpolators
+        for name in [
+            "_cum_norm_table",
+            "_time_ref",
+            "_time",
+            "_t_table",
+            "_norm_table",
+        ]:
+            self.__dict__.pop(name, None)
+
+    def _get_time_sampler(self, t_stop, t_step):
+        """Time grid and inverse CDF sampler used by `sample_time`.
+
+        Both are cached for the ``CDF_CACHE_SIZE`` most recently used time
+        grids, so that repeated sampling on the same time range only draws
+        the random numbers.
+        """
+        key = (t_stop, t_step)
+        value = self._cdf_cache.pop(key, None)
+
+        if value is None:
+            t = np.arange(0, t_stop, t_step)
+            value = t, InverseCDFSampler(pdf=self.evaluate(t))
+
+        # re-insert as most recently used and drop the least recently used
+        self._cdf_cache[key] = value
+        while len(self._cdf_cache) > self.CDF_CACHE_SIZE:
+            del self._cdf_cache[next(iter(self._cdf_cache))]
+
+        return value
+
     def __str__(self):
         norm = self.table["NORM"]
         return (
@@ -485,8 +572,10 @@ class LightCurveTemplateTemporalModel(TemporalModel):
 
         TODO: This doesn't read the XML part of the model yet.
         """
-        filename = str(make_path(path))
-        return cls(Table.read(filename), filename=filename)
+        path = make_path(path)
+        filename = str(path)
+        table = _read_table(str(path.resolve()), path.stat().st_mtime_ns)
+        return cls(table.copy(), filename=filename)
 
     def write(self, path=None, overwrite=False):
         if path is None:
@@ -497,12 +586,6 @@ class LightCurveTemplateTemporalModel(TemporalModel):
             self.filename = str(make_path(path))
             self.table.write(self.filename, overwrite=overwrite)
 
-    @lazyproperty
-    def _interpolator(self, ext=0):
-        x = self._time.value
-        y = self.table["NORM"].data
-        return scipy.interpolate.InterpolatedUnivariateSpline(x, y, k=1, ext=ext)
-
     @lazyproperty
     def _time_ref(self):
         return time_ref_from_dict(self.table.meta)
@@ -513,6 +596,33 @@ class LightCurveTemplateTemporalModel(TemporalModel):
             u, self.table.meta["TIMEUNIT"]
         )
 
+    @lazyproperty
+    def _t_table(self):
+        return np.asarray(self._time.mjd, dtype=np.float64)
+
+    @lazyproperty
+    def _norm_table(self):
+        return np.asarray(self.table["NORM"].data, dtype=np.float64)
+
+    @lazyproperty
+    def _cum_norm_table(self):
+        x, y = self._t_table, self._norm_table
+        cum_norm = np.cumsum(0.5 * (y[:-1] + y[1:]) * np.diff(x))
+        return np.concatenate([[0.0], cum_norm])
+
+    def _primitive(self, time):
+        """Primitive of the linearly interpolated light curve.
+
+        Outside the table range the first and last segments are extrapolated,
+        consistent with ``evaluate(time, ext=0)``.
+        """
+        time = time.mjd
+        x, y = self._t_table, self._norm_table
+        idx = np.clip(np.searchsorted(x, time, side="right") - 1, 0, len(x) - 2)
+        slope = (y[idx + 1] - y[idx]) / (x[idx + 1] - x[idx])
+        dt = time - x[idx]
+        return self._cum_norm_table[idx] + dt * (y[idx] + 0.5 * slope * dt)
+
     def evaluate(self, time, ext=0):
         """Evaluate for a given time.
 
@@ -521,8 +631,8 @@ class LightCurveTemplateTemporalModel(TemporalModel):
         time : array_like
             Time since the ``reference`` time.
         ext : int or str, optional, default: 0
-            Parameter passed to ~scipy.interpolate.InterpolatedUnivariateSpline
-            Controls the extrapolation mode for GTIs outside the range
+            Controls the extrapolation mode for GTIs outside the range,
+            with the same meaning as in `~scipy.interpolate.InterpolatedUnivariateSpline`
             0 or "extrapolate", return the extrapolated value.
             1 or "zeros", return 0
             2 or "raise", raise a ValueError
@@ -534,25 +644,30 @@ class LightCurveTemplateTemporalModel(TemporalModel):
         norm : array_like
             Norm at the given times.
         """
-        return self._interpolator(time, ext=ext)
+        ext = EXTRAPOLATION_MODES.get(ext, ext)
 
-    def integral(self, t_min, t_max):
-        """Evaluate the integrated flux within the given time intervals
+        if ext not in EXTRAPOLATION_MODES.values():
+            raise ValueError(f"Invalid extrapolation mode: {ext!r}")
 
-        Parameters
-        ----------
-        t_min: `~astropy.time.Time`
-            Start times of observation
-        t_max: `~astropy.time.Time`
-            Stop times of observation
-        Returns
-        -------
-        norm: The model integrated flux
-        """
+        if isinstance(time, u.Quantity):
+            time = time.to_value("day")
+
+        x, y = self._t_table, self._norm_table
 
-        n1 = self._interpolator.antiderivative()(t_max.mjd)
-        n2 = self._interpolator.antiderivative()(t_min.mjd)
-        return u.Quantity(n1 - n2, "day") / self.time_sum(t_min, t_max)
+        if ext == 2 and np.any((time < x[0]) | (time > x[-1])):
+            raise ValueError("Out of bounds")
+
+        fill_value = 0.0 if ext == 1 else None
+        norm = np.interp(time, x, y, left=fill_value, right=fill_value)
+
+        if ext == 0:
+            # linear extrapolation using the first and last segment
+            slope_min = (y[1] - y[0]) / (x[1] - x[0])
+            slope_max = (y[-1] - y[-2]) / (x[-1] - x[-2])
+            norm = np.where(time < x[0], y[0] + slope_min * (time - x[0]), norm)
+            norm = np.where(time > x[-1], y[-1] + slope_max * (time - x[-1]), norm)
+
+        return np.asarray(norm)
 
     @classmethod
     def from_dict(cls, data):
@@ -563,7 +678,7 @@ class LightCurveTemplateTemporalModel(TemporalModel):
         return {self._type: {"type": self.tag[0], "filename": self.filename}}
 
 
-class PowerLawTemporalModel(TemporalModel):
+class PowerLawTemporalModel(_VectorizedIntegralMixin, TemporalModel):
     """Temporal model with a Power Law decay.
 
     For more information see :ref:`powerlaw-temporal-model`.
@@ -588,38 +703,23 @@ class PowerLawTemporalModel(TemporalModel):
     @staticmethod
     def evaluate(time, alpha, t_ref, t0=1 * u.day):
         """Evaluate at given times"""
-        return np.power((time - t_ref) / t0, alpha)
+        time, t_ref, t0 = [_to_value(_, "d") for _ in (time, t_ref, t0)]
+        value = np.power((time - t_ref) / t0, _to_value(alpha, ""))
+        return u.Quantity(value, "", copy=False)
 
-    def integral(self, t_min, t_max):
-        """Evaluate the integrated flux within the given time intervals
-
-        Parameters
-        ----------
-        t_min: `~astropy.time.Time`
-            Start times of observation
-        t_max: `~astropy.time.Time`
-            Stop times of observation
-
-        Returns
-        -------
-        norm : float
-            Integrated flux norm on the given time intervals
-        """
+    def _primitive(self, time):
         pars = self.parameters
-        alpha = pars["alpha"].quantity
-        t0 = pars["t0"].quantity
-        t_ref = Time(pars["t_ref"].quantity, format="mjd")
+        alpha = pars["alpha"].value
+        t0 = pars["t0"].quantity.to_value("d")
+        x = self._time_delta(time, pars["t_ref"].quantity.to_value("d")) / t0
+
         if alpha != -1:
-            value = self.evaluate(t_max, alpha + 1.0, t_ref, t0) - self.evaluate(
-                t_min, alpha + 1.0, t_ref, t0
-            )
-            return t0 / (alpha + 1.0) * value / self.time_sum(t_min, t_max)
+            return t0 * x ** (alpha + 1.0) / (alpha + 1.0)
         else:
-            value = np.log((t_max - t_ref) / (t_min - t_ref))
-            return t0 * value / self.time_sum(t_min, t_max)
+            return t0 * np.log(x)
 
 
-class SineTemporalModel(TemporalModel):
+class SineTemporalModel(_VectorizedIntegralMixin, TemporalModel):
     """Temporal model with a sinusoidal modulation.
 
     For more information see :ref:`sine-temporal-model`.
@@ -644,29 +744,14 @@ class SineTemporalModel(TemporalModel):
     @staticmethod
     def evaluate(time, amp, omega, t_ref):
         """Evaluate at given times"""
-        return 1.0 + amp * np.sin(omega * (time - t_ref))
-
-    def integral(self, t_min, t_max):
-        """Evaluate the integrated flux within the given time intervals
-
-        Parameters
-        ----------
-        t_min: `~astropy.time.Time`
-            Start times of observation
-        t_max: `~astropy.time.Time`
-            Stop times of observation
+        time, t_ref = _to_value(time, "d"), _to_value(t_ref, "d")
+        amp, omega = _to_value(amp, ""), _to_value(omega, "rad d-1")
+        value = 1.0 + amp * np.sin(omega * (time - t_ref))
+        return u.Quantity(value, "", copy=False)
 
-        Returns
-        -------
-        norm : float
-            Integrated flux norm on the given time intervals
-        """
+    def _primitive(self, time):
         pars = self.parameters
         omega = pars["omega"].quantity.to_value("rad/day")
         amp = pars["amp"].value
-        t_ref = Time(pars["t_ref"].quantity, format="mjd")
-        value = (t_max - t_min) - amp / omega * (
-            np.sin(omega * (t_max - t_ref).to_value("day"))
-            - np.sin(omega * (t_min - t_ref).to_value("day"))
-        )
-        return value / self.time_sum(t_min, t_max)
+        dt = self._time_delta(time, pars["t_ref"].quantity.to_value("d"))
+        return dt - amp / omega * np.cos(omega * dt)
@@ -1,4 +1,5 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import os
 import pytest
 import numpy as np
 from numpy.testing import assert_allclose
@@ -47,6 +48,51 @@ def test_light_curve_evaluate(light_curve):
     assert_allclose(val, 0.01551196, rtol=1e-5)
 
 
+def test_light_curve_evaluate_ext():
+    table = Table()
+    table["TIME"] = [0, 1, 2] * u.day
+    table["NORM"] = [1.0, 2.0, 4.0]
+    table.meta = dict(MJDREFI=55197.0, MJDREFF=0, TIMEUNIT="d")
+    light_curve = LightCurveTemplateTemporalModel(table)
+
+    t = 55197 + np.array([-1, 0.5, 1.5, 3])
+
+    assert_allclose(light_curve.evaluate(t), [0, 1.5, 3, 6])
+    assert_allclose(light_curve.evaluate(t, ext="zeros"), [0, 1.5, 3, 0])
+    assert_allclose(light_curve.evaluate(t, ext=3), [1, 1.5, 3, 4])
+
+    with pytest.raises(ValueError):
+        light_curve.evaluate(t, ext="raise")
+
+    t_min = Time(55197 + np.array([0.5, 1]), format="mjd")
+    t_max = Time(55197 + np.array([1.5, 2]), format="mjd")
+    val = light_curve.integral(t_min, t_max)
+    # normalised to the total time of all intervals
+    assert_allclose(val.to_value(""), [1.0625, 1.5])
+
+
+def test_light_curve_read_cache(tmp_path):
+    table = Table()
+    table["TIME"] = [0, 1, 2] * u.day
+    table["NORM"] = [1.0, 2.0, 4.0]
+    table.meta = dict(MJDREFI=55197.0, MJDREFF=0, TIMEUNIT="d")
+    filename = tmp_path / "light_curve.fits"
+    table.write(filename)
+
+    light_curve = LightCurveTemplateTemporalModel.read(filename)
+    light_curve.table["NORM"][0] = 10.0
+
+    light_curve = LightCurveTemplateTemporalModel.read(filename)
+    assert_allclose(light_curve.table["NORM"], [1.0, 2.0, 4.0])
+
+    table["NORM"] = [3.0, 2.0, 1.0]
+    table.write(filename, overwrite=True)
+    os.utime(filename, ns=(0, 0))
+
+    light_curve = LightCurveTemplateTemporalModel.read(filename)
+    assert_allclose(light_curve.table["NORM"], [3.0, 2.0, 1.0])
+
+
 def rate(x, c="1e4 s"):
     c = u.Quantity(c)
     return np.exp(-x / c)
@@ -84,6 +130,36 @@ def test_time_sampling(tmp_path):
     assert len(sampler) == 2
     assert_allclose(sampler.value, [12661.65802564, 7826.92991], rtol=1e-5)
 
+    # second call re-uses the cached CDF
+    assert len(temporal_model._cdf_cache) == 1
+    sampler_cached = temporal_model.sample_time(
+        n_events=2, t_min=t_min, t_max=t_max, random_state=0, t_delta="10 min"
+    )
+    sampler_cached = u.Quantity((sampler_cached - Time(t_ref)).sec, "s")
+    assert_allclose(sampler_cached.value, sampler.value)
+
+    # the cache only keeps the most recently used time grids
+    for t_delta in ["1 min", "2 min", "3 min", "4 min", "5 min"]:
+        temporal_model.sample_time(
+            n_events=2, t_min=t_min, t_max=t_max, random_state=0, t_delta=t_delta
+        )
+    assert len(temporal_model._cdf_cache) == temporal_model.CDF_CACHE_SIZE
+
+    # numpy Generator, either from the seed or passed directly
+    temporal_model._use_legacy_rng = False
+    sampler_rng = temporal_model.sample_time(
+        n_events=2, t_min=t_min, t_max=t_max, random_state=0, t_delta="10 min"
+    )
+    sampler_generator = temporal_model.sample_time(
+        n_events=2,
+        t_min=t_min,
+        t_max=t_max,
+        random_state=np.random.default_rng(0),
+        t_delta="10 min",
+    )
+    assert_allclose(sampler_rng.mjd, sampler_generator.mjd)
+    assert np.all((sampler_rng >= Time(t_min)) & (sampler_rng <= Time(t_max)))
+
     table = Table()
     table["TIME"] = time
     table["NORM"] = np.ones(len(time))
@@ -203,6 +279,9 @@ def test_gaussian_temporal_model_evaluate():
     val = temporal_model(t)
     assert_allclose(val, 0.882497, rtol=1e-5)
 
+    val = temporal_model.evaluate(t.mjd, t_ref=46300, sigma=48 * u.h)
+    assert_allclose(val, 0.882497, rtol=1e-5)
+
 
 def test_gaussian_temporal_model_integral():
     temporal_model = GaussianTemporalModel(t_ref=50003 * u.d, sigma="2.0 day")
@@ -283,7 +362,27 @@ def test_sine_temporal_model_integral():
     gti = GTI.create(start, stop, reference_time=t_ref)
     val = temporal_model.integral(gti.time_start, gti.time_stop)
     assert len(val) == 3
-    assert_allclose(np.sum(val), 1.08261, rtol=1e-5)
+    assert_allclose(np.sum(val), 1.055201, rtol=1e-5)
+
+
+@pytest.mark.parametrize(
+    "model_class",
+    [
+        LinearTemporalModel,
+        ExpDecayTemporalModel,
+        GaussianTemporalModel,
+        GeneralizedGaussianTemporalModel,
+        PowerLawTemporalModel,
+        SineTemporalModel,
+    ],
+)
+def test_temporal_model_evaluate_unit(model_class):
+    t_ref = 46300 * u.d
+    temporal_model = model_class(t_ref=t_ref)
+    val = temporal_model(Time([46301, 46302], format="mjd"))
+    assert isinstance(val, u.Quantity)
+    assert val.unit == ""
+    assert val.shape == (2,)
 
 
 @requires_data()
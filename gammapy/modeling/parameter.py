@@ -4,8 +4,10 @@ import collections.abc
 import copy
 import itertools
 import logging
+from functools import lru_cache
 import numpy as np
 from astropy import units as u
+from astropy.utils import lazyproperty
 from gammapy.utils.interpolation import interpolation_scale
 from gammapy.utils.table import table_from_row_data
 
@@ -14,16 +16,24 @@ __all__ = ["Parameter", "Parameters"]
 log = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=512)
+def _parse_unit(unit):
+    """Parse a unit string, cached because string parsing is slow in astropy"""
+    return u.Unit(unit)
+
+
+# (value, error) line templates of `_get_parameters_str`, amplitudes in exponential notation
+_PARAMETER_LINE_FORMATS = {
+    True: ("\t{:21} {:8}: {:10.2e}\t {} {:<12s}\n", "+/- {:7.1e}"),
+    False: ("\t{:21} {:8}: {:10.3f}\t {} {:<12s}\n", "+/- {:7.2f}"),
+}
+
+
 def _get_parameters_str(parameters):
-    str_ = ""
+    lines = []
 
     for par in parameters:
-        if par.name == "amplitude":
-            value_format, error_format = "{:10.2e}", "{:7.1e}"
-        else:
-            value_format, error_format = "{:10.3f}", "{:7.2f}"
-
-        line = "\t{:21} {:8}: " + value_format + "\t {} {:<12s}\n"
+        line, error_format = _PARAMETER_LINE_FORMATS[par.name == "amplitude"]
 
         if par._link_label_io is not None:
             name = par._link_label_io
@@ -35,11 +45,11 @@ def _get_parameters_str(parameters):
         else:
             frozen = ""
             try:
-                error = "+/- " + error_format.format(par.error)
+                error = error_format.format(par.error)
             except AttributeError:
                 error = ""
-        str_ += line.format(name, frozen, par.value, error, par.unit)
-    return str_.expandtabs(tabsize=2)
+        lines.append(line.format(name, frozen, par.value, error, par.unit))
+    return "".join(lines).expandtabs(tabsize=2)
 
 
 class Parameter:
@@ -95,6 +105,28 @@ class Parameter:
         Whether the parameter represents the flux norm of the model.
     """
 
+    # parameters are created for every model instance, avoid a __dict__ per parameter
+    __slots__ = (
+        "_error",
+        "_factor",
+        "_frozen",
+        "_is_norm",
+        "_link_label_io",
+        "_max",
+        "_min",
+        "_name",
+        "_scale",
+        "_scale_method",
+        "_scan_max",
+        "_scan_min",
+        "_scan_n_sigma",
+        "_scan_values",
+        "_type",
+        "_unit",
+        "interp",
+        "scan_n_values",
+    )
+
     def __init__(
         self,
         name,
@@ -211,7 +243,10 @@ class Parameter:
 
     @unit.setter
     def unit(self, val):
-        self._unit = u.Unit(val)
+        if isinstance(val, str):
+            self._unit = _parse_unit(val)
+        else:
+            self._unit = u.Unit(val)
 
     @property
     def min(self):
@@ -560,6 +595,14 @@ class Parameters(collections.abc.Sequence):
         """List of parameter names"""
         return [par.name for par in self._parameters]
 
+    @lazyproperty
+    def _index_by_name(self):
+        """Position index of the first parameter with a given name"""
+        index = {}
+        for idx, par in enumerate(self._parameters):
+            index.setdefault(par.name, idx)
+        return index
+
     def index(self, val):
         """Get position index for a given parameter.
 
@@ -571,10 +614,10 @@ class Parameters(collections.abc.Sequence):
         elif isinstance(val, Parameter):
             return self._parameters.index(val)
         elif isinstance(val, str):
-            for idx, par in enumerate(self._parameters):
-                if val == par.name:
-                    return idx
-            raise IndexError(f"No parameter: {val!r}")
+            try:
+                return self._index_by_name[val]
+            except KeyError:
+                raise IndexError(f"No parameter: {val!r}")
         else:
             raise TypeError(f"Invalid type: {type(val)!r}")
 
@@ -628,13 +671,13 @@ class Parameters(collections.abc.Sequence):
 
     @classmethod
     def from_dict(cls, data):
-        parameters = []
+        parameters = [None] * len(data)
 
-        for par in data:
+        for idx, par in enumerate(data):
             link_label = par.pop("link", None)
             parameter = Parameter(**par)
             parameter._link_label_io = link_label
-            parameters.append(parameter)
+            parameters[idx] = parameter
 
         return cls(parameters=parameters)
 
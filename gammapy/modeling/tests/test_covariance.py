@@ -4,6 +4,11 @@ import pytest
 import numpy as np
 from numpy.testing import assert_allclose
 from gammapy.modeling import Covariance, Parameter, Parameters
+from gammapy.modeling.models import (
+    ConstantTemporalModel,
+    PowerLawSpectralModel,
+    SkyModel,
+)
 from gammapy.utils.testing import mpl_plot_check, requires_dependency
 
 
@@ -60,3 +65,28 @@ def test_scipy_mvn(covariance):
 def test_plot_correlation(covariance_diagonal):
     with mpl_plot_check():
         covariance_diagonal.plot_correlation()
+
+
+def test_model_covariance_errors():
+    model = PowerLawSpectralModel()
+    model.covariance = [[0.04, 0.01, 0], [0.01, 0.09, 0], [0, 0, 0]]
+    assert_allclose(model.index.error, 0.2)
+    assert_allclose(model.amplitude.error, 0.3)
+    assert_allclose(model.covariance.data[0, 1], 0.01)
+
+    # changing an error resets the correlations of that parameter only
+    model.index.error = 0.1
+    assert_allclose(model.covariance.data, [[0.01, 0, 0], [0, 0.09, 0], [0, 0, 0]])
+
+
+def test_model_covariance_no_parameters():
+    model = SkyModel(
+        spectral_model=PowerLawSpectralModel(),
+        temporal_model=ConstantTemporalModel(),
+        name="test",
+    )
+    assert ConstantTemporalModel().covariance.shape == (0, 0)
+
+    model.spectral_model.index.error = 0.1
+    assert model.covariance.shape == (3, 3)
+    assert_allclose(model.covariance.data[0, 0], 0.01)
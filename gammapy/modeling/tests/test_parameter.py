@@ -155,6 +155,15 @@ def test_parameters_getitem(pars):
         pars[Parameter("bam!", 99)]
 
 
+def test_parameters_getitem_duplicate_names():
+    a1 = Parameter("a", 1)
+    a2 = Parameter("a", 2)
+    parameters = Parameters([Parameter("b", 3), a1, a2])
+
+    assert parameters.index("a") == 1
+    assert parameters["a"] is a1
+
+
 def test_parameters_to_table(pars):
     pars["ham"].error = 1e-10
     pars["spam"]._link_label_io = "test"
@@ -30,6 +30,7 @@ GAMMAPY_DEPENDENCIES = [
     "iminuit",
     "sherpa",
     "naima",
+    "numba",
     "emcee",
     "corner",
 ]
@@ -17,13 +17,17 @@ class InverseCDFSampler:
         Map of the predicted source counts.
     axis : int
         Axis along which sampling the indexes.
-    random_state : {int, 'random-seed', 'global-rng', `~numpy.random.RandomState`}
+    random_state : {int, 'random-seed', 'global-rng', `~numpy.random.RandomState`, `~numpy.random.Generator`}
         Defines random number generator initialisation.
-        Passed to `~gammapy.utils.random.get_random_state`.
+        Passed to `~gammapy.utils.random.get_random_state`, a
+        `~numpy.random.Generator` is used as is.
     """
 
     def __init__(self, pdf, axis=None, random_state=0):
-        self.random_state = get_random_state(random_state)
+        if isinstance(random_state, np.random.Generator):
+            self.random_state = random_state
+        else:
+            self.random_state = get_random_state(random_state)
         self.axis = axis
 
         if axis is not None:
@@ -52,13 +56,17 @@ class InverseCDFSampler:
         cdf_all = np.insert(self.cdf, 0, 0, axis=1)
         edges = np.arange(shape_cdf[1] + 1) - 0.5
 
-        pix_coords = []
+        # vectorised equivalent of np.interp(choice, cdf, edges) for each row
+        idx = np.sum(cdf_all <= choices[:, np.newaxis], axis=1) - 1
+        idx = np.clip(idx, 0, shape_cdf[1] - 1)
+
+        rows = np.arange(len(cdf_all))
+        cdf_lo, cdf_hi = cdf_all[rows, idx], cdf_all[rows, idx + 1]
 
-        for cdf, choice in zip(cdf_all, choices):
-            pix = np.interp(choice, cdf, edges)
-            pix_coords.append(pix)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            frac = (choices - cdf_lo) / (cdf_hi - cdf_lo)
 
-        return np.array(pix_coords)
+        return edges[idx] + frac * (edges[idx + 1] - edges[idx])
 
     def sample(self, size):
         """Draw sample from the given PDF.
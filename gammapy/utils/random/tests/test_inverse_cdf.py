@@ -62,3 +62,13 @@ def test_axis_sampling():
     x_sampled = np.interp(idx, np.arange(n_sampled), x)
 
     assert_allclose(x_sampled, [0.012266, 0.43081], rtol=1e-4)
+
+
+def test_generator_sampling():
+    pdf = uniform_dist(np.linspace(-2, 2, 1000), a=-1, b=1)
+    sampler = InverseCDFSampler(pdf=pdf, random_state=np.random.default_rng(0))
+    assert isinstance(sampler.random_state, np.random.Generator)
+
+    idx = sampler.sample(int(1e4))
+    sampler = InverseCDFSampler(pdf=pdf, random_state=np.random.default_rng(0))
+    assert_allclose(sampler.sample(int(1e4)), idx)
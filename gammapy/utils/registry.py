@@ -5,13 +5,31 @@ __all__ = ["Registry"]
 class Registry(list):
     """Registry class."""
 
+    @property
+    def _tag_index(self):
+        """Dict of tag to first registered class with that tag.
+
+        Rebuilt whenever the registered classes have changed.
+        """
+        classes = tuple(self)
+
+        if getattr(self, "_tag_index_classes", None) != classes:
+            index = {}
+            for cls in classes:
+                tags = getattr(cls, "tag", [])
+                tags = [tags] if isinstance(tags, str) else tags
+                for tag in tags:
+                    index.setdefault(tag, cls)
+
+            self._tag_index_classes, self._tag_index_cache = classes, index
+
+        return self._tag_index_cache
+
     def get_cls(self, tag):
-        for cls in self:
-            tags = getattr(cls, "tag", [])
-            tags = [tags] if isinstance(tags, str) else tags
-            if tag in tags:
-                return cls
-        raise KeyError(f"No object found with tag: {tag!r}")
+        try:
+            return self._tag_index[tag]
+        except (KeyError, TypeError):
+            raise KeyError(f"No object found with tag: {tag!r}")
 
     def __str__(self):
         info = "Registry\n"
@@ -0,0 +1,29 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+import pytest
+from gammapy.utils.registry import Registry
+
+
+class A:
+    tag = ["A", "a"]
+
+
+class B:
+    tag = "b"
+
+
+class C:
+    tag = ["C", "a"]
+
+
+def test_registry_get_cls():
+    registry = Registry([A, B, C])
+
+    assert registry.get_cls("a") is A
+    assert registry.get_cls("b") is B
+    assert registry.get_cls("C") is C
+
+    with pytest.raises(KeyError):
+        registry.get_cls("d")
+
+    registry.remove(A)
+    assert registry.get_cls("a") is C